@@ -1,36 +1,78 @@
-"""Audio player using madplay for playback control."""
+"""Audio player using mpg123 in remote control mode for playback control."""
+import logging
 import subprocess
 import threading
 import time
-from typing import Optional
+from enum import IntEnum
+from typing import Callable, Dict, List, Optional
 import os
 import signal
 
 
+log = logging.getLogger(__name__)
+
+# Quiet period after the last seek press before the jump is applied
+SEEK_DEBOUNCE_SECONDS = 0.2
+
+
+class PlayerState(IntEnum):
+    """Playback state of the AudioPlayer."""
+    STOPPED = 0
+    PLAYING = 1
+    PAUSED = 2
+
+
 class AudioPlayer:
-    """Manages audio playback using madplay."""
+    """Manages audio playback using an mpg123 -R subprocess."""
     
-    def __init__(self, seek_seconds: int = 60, notification_sound_path: Optional[str] = None):
+    def __init__(self, seek_seconds: int = 60, notification_sound_path: Optional[str] = None,
+                 on_seek: Optional[Callable[[], None]] = None):
         """Initialize the audio player.
         
         Args:
             seek_seconds: Number of seconds to seek forward/backward
             notification_sound_path: Path to notification sound file
+            on_seek: Called once a debounced seek has been sent to mpg123
         """
         self.current_file: Optional[str] = None
-        self.is_playing = False
-        self.is_paused = False
+        self._state = PlayerState.STOPPED
         self.seek_seconds = seek_seconds
         self.notification_sound_path = notification_sound_path
+        # Checked once here rather than on every button press
+        self._notification_ok = bool(notification_sound_path) and os.path.exists(notification_sound_path)
+        if notification_sound_path and not self._notification_ok:
+            log.warning("Notification sound not found: %s", notification_sound_path)
         self.current_position = 0.0
         self.sleep_timer_end: Optional[float] = None
-        self.position_lock = threading.Lock()
-        self.monitor_thread: Optional[threading.Thread] = None
+        self._sleep_timer: Optional[threading.Timer] = None
+        # Guards only the pending seek; position is a single attribute that the
+        # status reader assigns and everyone else reads, so it needs no lock
+        self._seek_lock = threading.Lock()
+        self._pending_seek_delta = 0.0
+        self._seek_debounce_timer: Optional[threading.Timer] = None
+        self._on_seek = on_seek
+        self.reader_thread: Optional[threading.Thread] = None
         self.running = True
-        self.playback_start_time: Optional[float] = None
-        self.pause_time: Optional[float] = None
-        self.accumulated_pause_duration = 0.0
         self.process: Optional[subprocess.Popen] = None
+        self._stop_requested = False
+        # Files checked by register_file(), mapped to their duration in
+        # seconds once mpg123 has reported it
+        self._known_files: Dict[str, Optional[float]] = {}
+        # Set from sending LOADPAUSED until mpg123 answers '@P 1'; @F lines
+        # read in between may still belong to the previous track
+        self._awaiting_load = False
+        # Set while an announcement is loaded in place of the book
+        self._announcing = False
+        self._announcement_ok = False
+        self._announcement_error = False
+        self._announcement_done = threading.Event()
+        # Separate long-lived mpg123 for notifications so they mix over the book
+        self._notification_process: Optional[subprocess.Popen] = None
+        if self._notification_ok:
+            try:
+                self._ensure_notification_process()
+            except Exception as e:
+                log.error("Error starting notification player: %s", e)
     
     def start(self, audio_file: str, start_position: float = 0.0) -> bool:
         """Start playing an audio file.
@@ -42,132 +84,204 @@ class AudioPlayer:
         Returns:
             True if started successfully, False otherwise
         """
-        self.stop()
-        
         try:
-            if not os.path.exists(audio_file):
-                print(f"Audio file not found: {audio_file}")
+            if audio_file not in self._known_files and not self.register_file(audio_file):
                 return False
             
-            # Build madplay command with start position if needed
-            cmd = ['madplay', '-Q']
-            if start_position > 0:
-                # Format time as HH:MM:SS.SS
-                hours = int(start_position // 3600)
-                minutes = int((start_position % 3600) // 60)
-                seconds = start_position % 60
-                time_str = f"{hours}:{minutes:02d}:{seconds:06.3f}"
-                cmd.extend(['--start', time_str])
-            cmd.append(audio_file)
-            
-            # Start madplay process
-            self.process = subprocess.Popen(
-                cmd,
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-                preexec_fn=os.setsid  # Create new process group for clean killing
-            )
+            self._cancel_pending_seek()
+            self._ensure_process()
             
+            # Load paused so the seek happens before any audio is heard; this
+            # replaces whatever track the running mpg123 had loaded
+            commands = [f'LOADPAUSED {audio_file}']
+            if start_position > 0:
+                commands.append(f'JUMP {start_position:.3f}s')
+            commands.append('PAUSE')
+            self._awaiting_load = True
             self.current_file = audio_file
             self.current_position = start_position
-            self.playback_start_time = time.time() - start_position
-            self.accumulated_pause_duration = 0.0
-            self.is_playing = True
-            self.is_paused = False
+            self._send_commands(commands)
             
-            # Start monitor thread
-            self.monitor_thread = threading.Thread(target=self._monitor_playback, daemon=True)
-            self.monitor_thread.start()
+            self._state = PlayerState.PLAYING
             
-            print(f"Started playback: {audio_file} at {start_position:.1f}s")
+            log.info("Started playback: %s at %.1fs", audio_file, start_position)
             return True
             
         except Exception as e:
-            print(f"Error starting playback: {e}")
+            log.error("Error starting playback: %s", e)
             return False
     
+    def register_file(self, audio_file: str) -> bool:
+        """Check an audio file once so later starts skip the filesystem.
+        
+        Args:
+            audio_file: Path to the audio file
+            
+        Returns:
+            True if the file exists, False otherwise
+        """
+        if not os.path.isfile(audio_file):
+            log.error("Audio file not found: %s", audio_file)
+            return False
+        self._known_files.setdefault(audio_file, None)
+        return True
+    
+    def _ensure_process(self) -> None:
+        """Launch the long-lived mpg123 process if it is not running."""
+        if self.process and self.process.poll() is None:
+            return
+        if not self.running:
+            # A late background book switch must not leave an orphaned
+            # mpg123 playing after shutdown
+            raise RuntimeError("audio player has been shut down")
+        
+        # Start mpg123 in remote control mode; commands are sent on stdin
+        # and status lines (@F, @P, ...) are read back from stdout
+        self.process = subprocess.Popen(
+            ['mpg123', '-R'],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            errors='replace',  # ID3 tags in @I lines need not be valid UTF-8
+            bufsize=1,
+            start_new_session=True  # New process group for clean killing, vfork-safe
+        )
+        self._stop_requested = False
+        
+        # Start status reader thread
+        self.reader_thread = threading.Thread(
+            target=self._read_status, args=(self.process,), daemon=True
+        )
+        self.reader_thread.start()
+    
     def stop(self) -> None:
-        """Stop playback and cleanup."""
+        """Stop playback, keeping the mpg123 process for the next track."""
+        if self._state != PlayerState.STOPPED and self.process:
+            try:
+                # The resulting '@P 0' must not be reported as end of track
+                self._stop_requested = True
+                self._send_command('STOP')
+            except Exception as e:
+                log.error("Error stopping playback: %s", e)
+        
+        self._state = PlayerState.STOPPED
+        self.current_file = None
+        self.current_position = 0.0
+    
+    def _quit_process(self) -> None:
+        """Terminate the mpg123 process."""
         if self.process:
             try:
-                # Kill the entire process group
-                os.killpg(os.getpgid(self.process.pid), signal.SIGTERM)
-                self.process.wait(timeout=2.0)
+                # The process may already have exited on its own
+                if self.process.poll() is None:
+                    self._send_command('QUIT')
+                    self.process.wait(timeout=2.0)
             except Exception as e:
-                print(f"Error stopping process: {e}")
+                log.error("Error stopping process: %s", e)
                 try:
                     # Force kill if needed
                     os.killpg(os.getpgid(self.process.pid), signal.SIGKILL)
                 except:
                     pass
             self.process = None
-        
-        self.is_playing = False
-        self.is_paused = False
-        self.current_file = None
-        self.playback_start_time = None
-        self.pause_time = None
-        self.accumulated_pause_duration = 0.0
     
     def pause(self) -> None:
         """Pause playback."""
-        if self.is_playing and not self.is_paused and self.process:
+        if self._state == PlayerState.PLAYING and self.process:
             try:
-                # Send SIGSTOP to pause the process
-                os.killpg(os.getpgid(self.process.pid), signal.SIGSTOP)
-                self.is_paused = True
-                self.pause_time = time.time()
+                # PAUSE toggles between paused and playing in mpg123
+                self._send_command('PAUSE')
+                self._state = PlayerState.PAUSED
                 self.play_notification()
-                print("Paused")
+                log.debug("Paused")
             except Exception as e:
-                print(f"Error pausing: {e}")
+                log.error("Error pausing: %s", e)
     
     def resume(self) -> None:
         """Resume playback."""
-        if self.is_playing and self.is_paused and self.process:
+        if self._state == PlayerState.PAUSED and self.process:
             try:
-                # Send SIGCONT to resume the process
-                os.killpg(os.getpgid(self.process.pid), signal.SIGCONT)
-                if self.pause_time:
-                    self.accumulated_pause_duration += time.time() - self.pause_time
-                    self.pause_time = None
-                self.is_paused = False
+                self._send_command('PAUSE')
+                self._state = PlayerState.PLAYING
                 self.play_notification()
-                print("Resumed")
+                log.debug("Resumed")
             except Exception as e:
-                print(f"Error resuming: {e}")
+                log.error("Error resuming: %s", e)
     
     def toggle_play_pause(self) -> None:
         """Toggle between play and pause."""
-        if self.is_playing:
-            if self.is_paused:
-                self.resume()
-            else:
-                self.pause()
+        state = self._state
+        if state == PlayerState.PAUSED:
+            self.resume()
+        elif state == PlayerState.PLAYING:
+            self.pause()
     
     def seek_forward(self) -> None:
         """Seek forward by configured seconds."""
-        if self.is_playing:
-            # For madplay, we need to restart from new position
-            with self.position_lock:
-                new_pos = self.current_position + self.seek_seconds
-                print(f"Seeking forward {self.seek_seconds}s to {new_pos:.1f}s")
-                was_paused = self.is_paused
-                self.start(self.current_file, new_pos)
-                if was_paused:
-                    self.pause()
+        self.seek_relative(self.seek_seconds)
     
     def seek_backward(self) -> None:
         """Seek backward by configured seconds."""
-        if self.is_playing:
-            # For madplay, we need to restart from new position
-            with self.position_lock:
-                new_pos = max(0, self.current_position - self.seek_seconds)
-                print(f"Seeking backward {self.seek_seconds}s to {new_pos:.1f}s")
-                was_paused = self.is_paused
-                self.start(self.current_file, new_pos)
-                if was_paused:
-                    self.pause()
+        self.seek_relative(-self.seek_seconds)
+    
+    def seek_relative(self, delta: float) -> None:
+        """Seek by an arbitrary number of seconds.
+        
+        Calls arriving within SEEK_DEBOUNCE_SECONDS of each other are summed
+        and applied as a single jump once they stop, so callers can forward
+        every button press without debouncing themselves. The on_seek
+        callback fires once the jump has actually been sent.
+        
+        Args:
+            delta: Seconds to move, negative to seek backward
+        """
+        if self._state != PlayerState.STOPPED and self.process:
+            with self._seek_lock:
+                self._pending_seek_delta += delta
+                if self._seek_debounce_timer:
+                    self._seek_debounce_timer.cancel()
+                self._seek_debounce_timer = threading.Timer(
+                    SEEK_DEBOUNCE_SECONDS, self._apply_pending_seek
+                )
+                self._seek_debounce_timer.daemon = True
+                self._seek_debounce_timer.start()
+    
+    def _apply_pending_seek(self) -> None:
+        """Jump to the accumulated seek target without restarting mpg123."""
+        with self._seek_lock:
+            delta = self._pending_seek_delta
+            self._pending_seek_delta = 0.0
+            self._seek_debounce_timer = None
+            if not delta or self._state == PlayerState.STOPPED or not self.process:
+                return
+            new_pos = self.current_position + delta
+            # Jumping past the end would just finish the book, but an
+            # underestimated length must not turn a forward press backward
+            duration = self._known_files.get(self.current_file)
+            if duration and new_pos > duration - 1.0:
+                new_pos = max(duration - 1.0, min(self.current_position, new_pos))
+            new_pos = max(0.0, new_pos)
+            self.current_position = new_pos
+        
+        try:
+            log.debug("Seeking %+.0fs to %.1fs", delta, new_pos)
+            self._send_command(f'JUMP {new_pos:.3f}s')
+        except Exception as e:
+            log.error("Error seeking: %s", e)
+            return
+        
+        # Only now does current_position hold the seek target
+        if self._on_seek:
+            self._on_seek()
+    
+    def _cancel_pending_seek(self) -> None:
+        """Drop a queued seek, e.g. when another track is loaded."""
+        with self._seek_lock:
+            if self._seek_debounce_timer:
+                self._seek_debounce_timer.cancel()
+                self._seek_debounce_timer = None
+            self._pending_seek_delta = 0.0
     
     def add_sleep_timer(self, minutes: int) -> None:
         """Add time to sleep timer.
@@ -175,16 +289,25 @@ class AudioPlayer:
         Args:
             minutes: Minutes to add to the sleep timer
         """
-        if self.is_playing and not self.is_paused:
-            current_time = time.time()
+        if self._state == PlayerState.PLAYING:
+            current_time = time.monotonic()
             if self.sleep_timer_end is None or self.sleep_timer_end <= current_time:
                 self.sleep_timer_end = current_time + (minutes * 60)
             else:
                 self.sleep_timer_end += (minutes * 60)
             
+            # Re-arm a single timer for the new deadline
+            if self._sleep_timer:
+                self._sleep_timer.cancel()
+            self._sleep_timer = threading.Timer(
+                self.sleep_timer_end - current_time, self._on_sleep_expired
+            )
+            self._sleep_timer.daemon = True
+            self._sleep_timer.start()
+            
             remaining = int((self.sleep_timer_end - current_time) / 60)
             self.play_notification()
-            print(f"Sleep timer set: {remaining} minutes remaining")
+            log.debug("Sleep timer set: %d minutes remaining", remaining)
     
     def get_position(self) -> float:
         """Get current playback position.
@@ -192,8 +315,7 @@ class AudioPlayer:
         Returns:
             Current position in seconds
         """
-        with self.position_lock:
-            return self.current_position
+        return self.current_position
     
     def is_active(self) -> bool:
         """Check if player is actively playing (not paused).
@@ -201,87 +323,238 @@ class AudioPlayer:
         Returns:
             True if playing and not paused
         """
-        return self.is_playing and not self.is_paused
+        return self._state == PlayerState.PLAYING
+    
+    @property
+    def is_playing(self) -> bool:
+        """True while a track is loaded, whether playing or paused."""
+        return self._state != PlayerState.STOPPED
+    
+    @property
+    def is_paused(self) -> bool:
+        """True while the loaded track is paused."""
+        return self._state == PlayerState.PAUSED
+    
+    def _send_command(self, command: str) -> None:
+        """Send a remote control command to mpg123.
+        
+        Args:
+            command: Command line without trailing newline
+        """
+        self._send_commands([command])
     
-    def _monitor_playback(self) -> None:
-        """Monitor playback and handle sleep timer."""
-        while self.running and self.is_playing:
-            time.sleep(0.5)
+    def _send_commands(self, commands: List[str]) -> None:
+        """Send several remote control commands to mpg123 in one write.
+        
+        mpg123 reads them back to back, so e.g. a load, jump and unpause take
+        effect together without audio playing in between.
+        
+        Args:
+            commands: Command lines without trailing newlines
+        """
+        self.process.stdin.write('\n'.join(commands) + '\n')
+        self.process.stdin.flush()
+    
+    def _read_status(self, process: subprocess.Popen) -> None:
+        """Read mpg123 status output to track position and end of track.
+        
+        stdout must be drained for as long as mpg123 runs, otherwise the pipe
+        fills up and mpg123 blocks, so a bad line never ends this loop.
+        
+        Args:
+            process: The mpg123 process whose output is read
+        """
+        for line in process.stdout:
+            if self.process is not process:
+                # Superseded by a newer process; just drain until it exits
+                continue
             
-            # Update position based on elapsed time (excluding pause time)
-            if not self.is_paused and self.playback_start_time is not None:
-                current_time = time.time()
-                with self.position_lock:
-                    # Calculate position: elapsed time minus accumulated pause duration
-                    self.current_position = (current_time - self.playback_start_time - 
-                                            self.accumulated_pause_duration)
-                
-                # Check if process is still running
-                if self.process and self.process.poll() is not None:
-                    print("Playback finished")
-                    self.is_playing = False
-                    break
-                
-                # Check sleep timer
-                if self.sleep_timer_end and current_time >= self.sleep_timer_end:
-                    print("Sleep timer expired, pausing playback")
-                    self.pause()
-                    self.sleep_timer_end = None
+            try:
+                self._handle_status_line(line)
+            except Exception as e:
+                log.error("Error handling mpg123 output %r: %s", line, e)
+        
+        # stdout closes when mpg123 exits, so a crash is noticed immediately
+        if self.process is process:
+            self._announcement_done.set()
+            if self._state != PlayerState.STOPPED:
+                self._on_eof()
+    
+    def _handle_status_line(self, line: str) -> None:
+        """Handle one line of mpg123 remote control output.
+        
+        Args:
+            line: Status line such as '@F ...' or '@P 0'
+        """
+        if line.startswith('@F '):
+            if self._announcing or self._awaiting_load or self._state == PlayerState.STOPPED:
+                # Announcement progress is not the book position, and frames
+                # read before a load is acknowledged or after stop() are the
+                # old track's
+                return
+            # @F <frame> <frames left> <seconds> <seconds left>
+            parts = line.split()
+            try:
+                position = float(parts[3])
+            except (IndexError, ValueError):
+                return
+            self.current_position = position
+            
+            # Every frame also reports the total duration; keep the latest,
+            # since mpg123 refines its estimate for VBR files without a header
+            if self.current_file in self._known_files:
+                try:
+                    self._known_files[self.current_file] = position + float(parts[4])
+                except (IndexError, ValueError):
+                    pass
+        elif line.startswith('@P 1'):
+            # LOADPAUSED acknowledged; a stray ack from a pause just before the
+            # load is harmless because a paused mpg123 emits no frames
+            self._awaiting_load = False
+        elif line.startswith('@P 0'):
+            if self._stop_requested:
+                self._stop_requested = False
+            elif self._announcing:
+                # mpg123 follows an open error with '@P 0' as well
+                self._announcement_ok = not self._announcement_error
+                self._announcement_done.set()
+            else:
+                # Track reached its end
+                self._on_eof()
+        elif line.startswith('@E '):
+            if self._announcing:
+                # mpg123 could not open or decode the announcement
+                self._announcement_error = True
+            else:
+                # A failed load is never acknowledged with '@P 1'
+                self._awaiting_load = False
+                log.error("mpg123: %s", line[3:].strip())
+    
+    def _on_eof(self) -> None:
+        """Mark playback as finished."""
+        log.info("Playback finished")
+        self._state = PlayerState.STOPPED
+    
+    def _on_sleep_expired(self) -> None:
+        """Pause playback when the sleep timer fires."""
+        log.info("Sleep timer expired, pausing playback")
+        self.sleep_timer_end = None
+        self._sleep_timer = None
+        self.pause()
     
     def play_announcement(self, announcement_file: str) -> bool:
         """Play an announcement file and wait for it to complete.
         
+        The announcement is loaded into the same mpg123 process as the book,
+        so the audio device is never opened twice. Afterwards the previous
+        book is reloaded at its position in its previous play/pause state.
+        
         Args:
             announcement_file: Path to the announcement audio file
             
         Returns:
             True if announcement played successfully, False otherwise
         """
-        if not os.path.exists(announcement_file):
-            print(f"Announcement file not found: {announcement_file}")
-            return False
+        state = self._state
+        saved_file = self.current_file if state != PlayerState.STOPPED else None
+        saved_position = self.current_position
+        was_paused = state == PlayerState.PAUSED
         
         try:
-            # Play announcement using madplay and wait for completion
-            print(f"Playing announcement: {announcement_file}")
-            result = subprocess.run(
-                ['madplay', '-Q', announcement_file],
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-                timeout=30  # 30 second timeout for announcements
-            )
+            self._ensure_process()
+            self._cancel_pending_seek()
+            self._announcement_ok = False
+            self._announcement_error = False
+            self._announcement_done.clear()
+            self._announcing = True
             
-            return result.returncode == 0
+            # LOAD replaces the book and starts playing immediately
+            log.debug("Playing announcement: %s", announcement_file)
+            self._send_command(f'LOAD {announcement_file}')
+            if not self._announcement_done.wait(timeout=30):  # 30 second timeout for announcements
+                log.error("Announcement timed out")
+            elif not self.running:
+                # Cut short by cleanup(), not a bad file
+                return False
+            elif not self._announcement_ok:
+                # Let mpg123 report a missing file instead of checking up front
+                log.error("Announcement file not found or unplayable: %s", announcement_file)
+            return self._announcement_ok
             
-        except subprocess.TimeoutExpired:
-            print("Announcement timed out")
-            return False
         except Exception as e:
-            print(f"Error playing announcement: {e}")
+            log.error("Error playing announcement: %s", e)
             return False
+        finally:
+            self._announcing = False
+            if saved_file:
+                self._restore_track(saved_file, saved_position, was_paused)
     
-    def play_notification(self) -> None:
-        """Play a notification sound in the background without interrupting playback."""
-        if not self.notification_sound_path:
+    def _restore_track(self, audio_file: str, position: float, paused: bool) -> None:
+        """Reload a track at a position after an announcement replaced it.
+        
+        Args:
+            audio_file: Path to the audio file
+            position: Position in seconds
+            paused: True to leave the track paused
+        """
+        commands = [f'LOADPAUSED {audio_file}', f'JUMP {position:.3f}s']
+        if not paused:
+            commands.append('PAUSE')
+        try:
+            self._awaiting_load = True
+            self.current_position = position
+            self._send_commands(commands)
+        except Exception as e:
+            log.error("Error restoring playback: %s", e)
+    
+    def _ensure_notification_process(self) -> None:
+        """Launch the long-lived mpg123 used for notification sounds."""
+        if self._notification_process and self._notification_process.poll() is None:
             return
         
-        if not os.path.exists(self.notification_sound_path):
-            print(f"Notification sound not found: {self.notification_sound_path}")
+        self._notification_process = subprocess.Popen(
+            ['mpg123', '-R'],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            bufsize=1,
+            start_new_session=True
+        )
+        # Status output is not needed for notifications
+        self._notification_process.stdin.write('SILENCE\n')
+        self._notification_process.stdin.flush()
+    
+    def play_notification(self) -> None:
+        """Play a notification sound in the background without interrupting playback."""
+        if not self._notification_ok:
             return
         
         try:
-            # Play notification in background using madplay
-            subprocess.Popen(
-                ['madplay', '-Q', self.notification_sound_path],
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL
-            )
+            # Reuse the running notification player instead of forking one per press
+            self._ensure_notification_process()
+            self._notification_process.stdin.write(f'LOAD {self.notification_sound_path}\n')
+            self._notification_process.stdin.flush()
         except Exception as e:
-            print(f"Error playing notification: {e}")
+            log.error("Error playing notification: %s", e)
     
     def cleanup(self) -> None:
         """Cleanup resources."""
         self.running = False
+        if self._sleep_timer:
+            self._sleep_timer.cancel()
+        self._cancel_pending_seek()
         self.stop()
-        if self.monitor_thread:
-            self.monitor_thread.join(timeout=2.0)
+        self._quit_process()
+        # Wake an announcement still waiting on the process that just quit
+        self._announcement_done.set()
+        if self._notification_process and self._notification_process.poll() is None:
+            try:
+                self._notification_process.stdin.write('QUIT\n')
+                self._notification_process.stdin.flush()
+                self._notification_process.wait(timeout=2.0)
+            except Exception as e:
+                log.error("Error stopping notification player: %s", e)
+                self._notification_process.kill()
+        if self.reader_thread:
+            self.reader_thread.join(timeout=2.0)
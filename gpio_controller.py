@@ -1,8 +1,13 @@
 """GPIO controller with support for both real Raspberry Pi GPIO and mock mode."""
+import logging
+import os
 import sys
 import threading
 from abc import ABC, abstractmethod
-from typing import Callable, List
+from typing import Callable, List, Optional
+
+
+log = logging.getLogger(__name__)
 
 
 class GPIOInterface(ABC):
@@ -40,20 +45,29 @@ class RaspberryPiGPIO(GPIOInterface):
             self.LED = LED
             self.buttons = {}
             self.leds = {}
-            print("Initialized Raspberry Pi GPIO (gpiozero)")
         except ImportError:
             raise RuntimeError("gpiozero not available. Use --mock flag for testing.")
+        
+        # Prefer the lgpio backend: it debounces in the kernel and delivers all
+        # edge callbacks from lgpio's single alert thread
+        self.pin_factory = None
+        try:
+            from gpiozero.pins.lgpio import LGPIOFactory
+            self.pin_factory = LGPIOFactory()
+            log.info("Initialized Raspberry Pi GPIO (gpiozero, lgpio backend)")
+        except Exception:
+            log.info("Initialized Raspberry Pi GPIO (gpiozero)")
     
     def setup_button(self, pin: int, callback: Callable) -> None:
         """Setup a button with pull-up resistor and callback."""
         # gpiozero Button uses pull_up=True by default, detects when_pressed
-        button = self.Button(pin, pull_up=True, bounce_time=0.3)
+        button = self.Button(pin, pull_up=True, bounce_time=0.3, pin_factory=self.pin_factory)
         button.when_pressed = callback
         self.buttons[pin] = button
     
     def setup_led(self, pin: int) -> None:
         """Setup an LED pin."""
-        led = self.LED(pin)
+        led = self.LED(pin, pin_factory=self.pin_factory)
         led.off()
         self.leds[pin] = led
     
@@ -71,39 +85,49 @@ class RaspberryPiGPIO(GPIOInterface):
             button.close()
         for led in self.leds.values():
             led.close()
-        print("GPIO cleanup complete")
+        log.info("GPIO cleanup complete")
 
 
 class MockGPIO(GPIOInterface):
     """Mock GPIO implementation for testing on non-Pi systems."""
     
-    def __init__(self):
-        """Initialize mock GPIO."""
+    def __init__(self, verbose_leds: bool = False):
+        """Initialize mock GPIO.
+        
+        Args:
+            verbose_leds: If True, print LED changes to the console
+        """
+        self.verbose_leds = verbose_leds
         self.buttons = {}
         self.leds = {}
+        self._led_order: dict[int, int] = {}
         self.running = False
         self.input_thread = None
-        print("Initialized Mock GPIO (keyboard control)")
-        print("Controls: p=Play/Pause, s=Sleep, n=Next, b=Back, f=Forward, r=Rewind, q=Quit")
+        # Writing to this pipe wakes the input thread so cleanup is immediate
+        self._wake_r, self._wake_w = os.pipe()
+        log.info("Initialized Mock GPIO (keyboard control)")
+        log.info("Controls: p=Play/Pause, s=Sleep, n=Next, b=Back, f=Forward, r=Rewind, q=Quit")
     
     def setup_button(self, pin: int, callback: Callable) -> None:
         """Setup a button with callback."""
         self.buttons[pin] = callback
-        print(f"Mock button setup on pin {pin}")
+        log.debug("Mock button setup on pin %d", pin)
     
     def setup_led(self, pin: int) -> None:
         """Setup an LED pin."""
         self.leds[pin] = False
-        print(f"Mock LED setup on pin {pin}")
+        self._led_order[pin] = len(self._led_order)
+        log.debug("Mock LED setup on pin %d", pin)
     
     def set_led(self, pin: int, state: bool) -> None:
         """Set LED state (on/off)."""
         if pin in self.leds:
             self.leds[pin] = state
             # Visual feedback in console
-            led_index = list(self.leds.keys()).index(pin)
-            status = "ON " if state else "OFF"
-            print(f"LED {led_index + 1}: [{status}]", end="\r")
+            if self.verbose_leds:
+                led_index = self._led_order[pin]
+                status = "ON " if state else "OFF"
+                print(f"LED {led_index + 1}: [{status}]", end="\r")
     
     def start_keyboard_control(self, button_map: dict) -> None:
         """Start keyboard input thread for simulating button presses.
@@ -115,33 +139,52 @@ class MockGPIO(GPIOInterface):
         self.button_map = button_map
         
         def input_loop():
-            print("\nKeyboard controls active. Press keys to simulate buttons.")
-            while self.running:
-                try:
-                    # Read single character (Unix-like systems)
-                    import select
-                    import tty
-                    import termios
+            log.info("Keyboard controls active. Press keys to simulate buttons.")
+            try:
+                # Read single characters (Unix-like systems)
+                import select
+                import tty
+                import termios
+                
+                # Switch to cbreak once for the whole loop and restore on exit.
+                # stdin stays blocking: select() below only returns once a
+                # read will not block, and on a terminal O_NONBLOCK would
+                # also apply to stdout, which shares its open file
+                fd = sys.stdin.fileno()
+                old_settings = termios.tcgetattr(fd)
+            except Exception as e:
+                # Fallback to simple input() for systems without termios
+                log.error("Keyboard control error: %s", e)
+                return
+            
+            try:
+                tty.setcbreak(fd)
+                while self.running:
+                    # Sleep until a key arrives or cleanup() wakes us
+                    readable = select.select([fd, self._wake_r], [], [])[0]
+                    if self._wake_r in readable:
+                        os.read(self._wake_r, 64)
+                        continue
+                    data = os.read(fd, 16)
+                    if not data:
+                        # stdin was closed
+                        break
                     
-                    old_settings = termios.tcgetattr(sys.stdin)
-                    try:
-                        tty.setcbreak(sys.stdin.fileno())
-                        if select.select([sys.stdin], [], [], 0.1)[0]:
-                            key = sys.stdin.read(1).lower()
-                            if key in self.button_map:
-                                pin = self.button_map[key]
-                                if pin in self.buttons:
-                                    print(f"\nButton press: {key}")
-                                    self.buttons[pin]()
-                            elif key == 'q':
-                                print("\nQuit requested")
-                                self.running = False
-                    finally:
-                        termios.tcsetattr(sys.stdin, termios.TCSADRAIN, old_settings)
-                except Exception as e:
-                    # Fallback to simple input() for systems without termios
-                    print(f"Keyboard control error: {e}")
-                    break
+                    # Handle every key that arrived since the last wakeup
+                    for key in data.decode(errors='ignore').lower():
+                        if key in self.button_map:
+                            pin = self.button_map[key]
+                            if pin in self.buttons:
+                                log.debug("Button press: %s", key)
+                                self.buttons[pin]()
+                        elif key == 'q':
+                            log.info("Quit requested")
+                            self.running = False
+                            break
+            except Exception as e:
+                log.error("Keyboard control error: %s", e)
+            finally:
+                termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
         
         self.input_thread = threading.Thread(target=input_loop, daemon=True)
         self.input_thread.start()
@@ -149,30 +192,33 @@ class MockGPIO(GPIOInterface):
     def cleanup(self) -> None:
         """Cleanup GPIO resources."""
         self.running = False
+        os.write(self._wake_w, b'x')
         if self.input_thread:
             self.input_thread.join(timeout=1.0)
-        print("\nMock GPIO cleanup complete")
+        log.info("Mock GPIO cleanup complete")
 
 
 class GPIOController:
     """Main GPIO controller that manages buttons and LEDs."""
     
-    def __init__(self, gpio_pins: dict, mock_mode: bool = False):
+    def __init__(self, gpio_pins: dict, mock_mode: bool = False, verbose_leds: bool = False):
         """Initialize GPIO controller.
         
         Args:
             gpio_pins: Dictionary with 'buttons' and 'leds' pin assignments
             mock_mode: If True, use mock GPIO instead of real hardware
+            verbose_leds: If True, mock mode prints LED changes to the console
         """
         self.gpio_pins = gpio_pins
         self.mock_mode = mock_mode
         
         if mock_mode:
-            self.gpio = MockGPIO()
+            self.gpio = MockGPIO(verbose_leds=verbose_leds)
         else:
             self.gpio = RaspberryPiGPIO()
         
         self.led_pins = gpio_pins['leds']
+        self._last_active_index: Optional[int] = None
     
     def setup_buttons(self, callbacks: dict) -> None:
         """Setup all buttons with their callbacks.
@@ -209,8 +255,16 @@ class GPIOController:
         Args:
             active_book_index: Index of the currently active book (0-based)
         """
-        for i, pin in enumerate(self.led_pins):
-            self.gpio.set_led(pin, i == active_book_index)
+        # LEDs start off, so only the previously and newly active pins change
+        if active_book_index == self._last_active_index:
+            return
+        if self._last_active_index is not None:
+            self.gpio.set_led(self.led_pins[self._last_active_index], False)
+        if 0 <= active_book_index < len(self.led_pins):
+            self.gpio.set_led(self.led_pins[active_book_index], True)
+            self._last_active_index = active_book_index
+        else:
+            self._last_active_index = None
     
     def cleanup(self) -> None:
         """Cleanup GPIO resources."""
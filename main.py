@@ -4,51 +4,99 @@ Main entry point for the Raspberry Pi Audiobook Player.
 """
 import argparse
 import json
+import logging
+import os
+import queue
 import signal
 import sys
-import time
 import threading
+from logging.handlers import QueueHandler, QueueListener
 from typing import List, Dict
 
+try:
+    import orjson
+except ImportError:
+    # Optional speedup; the stdlib json module is used without it
+    orjson = None
+
 from audio_player import AudioPlayer
 from gpio_controller import GPIOController
 from state_manager import StateManager
 
 
+log = logging.getLogger(__name__)
+
+
 class AudiobookPlayer:
     """Main audiobook player application."""
     
-    def __init__(self, config: dict, mock_mode: bool = False):
+    def __init__(self, config: dict, mock_mode: bool = False, verbose_leds: bool = False):
         """Initialize the audiobook player.
         
         Args:
             config: Configuration dictionary
             mock_mode: If True, run in mock mode for testing
+            verbose_leds: If True, print LED changes in mock mode
         """
         self.config = config
         self.mock_mode = mock_mode
         self.running = True
         
+        # Set when the position needs saving: by button handlers, and by the
+        # audio player once a debounced seek has actually been applied
+        self._dirty = threading.Event()
+        
         # Initialize components
         self.state_manager = StateManager(config['state_file'])
         self.audio_player = AudioPlayer(
             seek_seconds=config['seek_seconds'],
-            notification_sound_path=config.get('notification_sound_path')
+            notification_sound_path=config.get('notification_sound_path'),
+            on_seek=self._dirty.set
         )
-        self.gpio_controller = GPIOController(config['gpio_pins'], mock_mode=mock_mode)
+        self.gpio_controller = GPIOController(
+            config['gpio_pins'], mock_mode=mock_mode, verbose_leds=verbose_leds
+        )
+        
+        # Bound methods used on every button press and save
+        self._get_pos = self.audio_player.get_position
+        self._set_pos = self.state_manager.set_position
+        self._save = self.state_manager.save_state
+        self._get_book = self.state_manager.get_book
         
         self.audiobooks: List[Dict[str, str]] = config['audiobooks']
+        # Neighbouring book for each index, wrapping around at the ends; an
+        # invalid saved index falls back to the first book
+        n = len(self.audiobooks)
+        self._next_of = {i: (i + 1) % n for i in range(n)}
+        self._prev_of = {i: (i - 1) % n for i in range(n)}
         self.save_interval = config['save_interval_seconds']
         self.sleep_timer_minutes = config['sleep_timer_minutes']
         self.book_announcement_path = config.get('book_announcement_path', 'announcements')
         
+        # Check the configured books once up front instead of on every start
+        for book in self.audiobooks:
+            if book['path']:
+                self.audio_player.register_file(book['path'])
+        
+        # Announcement for each book (file named {book_index + 1}.mp3),
+        # resolved and checked once so a book switch does no filesystem work
+        self._announcements = [
+            f"{self.book_announcement_path}/{i + 1}.mp3" for i in range(n)
+        ]
+        self._announcements_exist = [os.path.isfile(p) for p in self._announcements]
+        
+        # Serializes the audio half of book switches
+        self._switch_lock = threading.Lock()
+        # Held while the player's position is copied into the state, and
+        # while the book and the track it belongs to change. It orders
+        # _persist_position against button and switch threads only; the
+        # mpg123 status reader writes the position without it and instead
+        # ignores frames between stop() and the new track's load ack
+        self._book_lock = threading.Lock()
+        
         # Setup GPIO
         self._setup_gpio()
         
-        # Start state saving thread
-        self.save_thread = threading.Thread(target=self._auto_save_loop, daemon=True)
-        self.save_thread.start()
-        
         # Start playing last audiobook
         self._start_current_book()
     
@@ -75,111 +123,141 @@ class AudiobookPlayer:
         
         if 0 <= book_index < len(self.audiobooks):
             book = self.audiobooks[book_index]
-            print(f"\nStarting: {book['name']}")
+            log.info("Starting: %s", book['name'])
             self.audio_player.start(book['path'], position)
             self.gpio_controller.update_book_leds(book_index)
         else:
-            print(f"Invalid book index: {book_index}")
+            log.error("Invalid book index: %d", book_index)
     
     def _on_play_pause(self) -> None:
         """Handle play/pause button press."""
-        print("\n[Button] Play/Pause")
+        log.debug("[Button] Play/Pause")
         self.audio_player.toggle_play_pause()
-        # Save state after play/pause
-        current_position = self.audio_player.get_position()
-        self.state_manager.set_position(current_position)
-        self.state_manager.save_state()
+        # Saved by the periodic save on the main thread, off the button callback
+        self._dirty.set()
     
     def _on_sleep_timer(self) -> None:
         """Handle sleep timer button press."""
-        print(f"\n[Button] Sleep Timer (+{self.sleep_timer_minutes} min)")
+        log.debug("[Button] Sleep Timer (+%d min)", self.sleep_timer_minutes)
         self.audio_player.add_sleep_timer(self.sleep_timer_minutes)
     
     def _on_next_book(self) -> None:
         """Handle next book button press."""
-        print("\n[Button] Next Book")
-        current_book = self.state_manager.get_book()
-        next_book = (current_book + 1) % len(self.audiobooks)
-        self._switch_book(next_book)
-        # State is saved in _switch_book
+        log.debug("[Button] Next Book")
+        self._switch_book(self._next_of.get(self._get_book(), 0))
     
     def _on_prev_book(self) -> None:
         """Handle previous book button press."""
-        print("\n[Button] Previous Book")
-        current_book = self.state_manager.get_book()
-        prev_book = (current_book - 1) % len(self.audiobooks)
-        self._switch_book(prev_book)
-        # State is saved in _switch_book
+        log.debug("[Button] Previous Book")
+        self._switch_book(self._prev_of.get(self._get_book(), 0))
     
     def _on_forward(self) -> None:
         """Handle forward button press."""
-        print("\n[Button] Forward")
+        log.debug("[Button] Forward")
+        # Marked dirty through on_seek once the debounced jump lands
         self.audio_player.seek_forward()
-        # Save state after seeking
-        current_position = self.audio_player.get_position()
-        self.state_manager.set_position(current_position)
-        self.state_manager.save_state()
     
     def _on_backward(self) -> None:
         """Handle backward button press."""
-        print("\n[Button] Backward")
+        log.debug("[Button] Backward")
         self.audio_player.seek_backward()
-        # Save state after seeking
-        current_position = self.audio_player.get_position()
-        self.state_manager.set_position(current_position)
-        self.state_manager.save_state()
     
     def _switch_book(self, book_index: int) -> None:
         """Switch to a different audiobook.
         
+        The LEDs and state change immediately on the calling button thread;
+        the announcement and the new book follow on a background thread, so
+        the callback does not wait for audio.
+        
         Args:
             book_index: Index of the book to switch to
         """
         if 0 <= book_index < len(self.audiobooks):
-            # Save current position first
-            current_position = self.audio_player.get_position()
-            self.state_manager.set_position(current_position)
-            self.state_manager.save_state()
+            self._switch_book_ui(book_index)
+            threading.Thread(
+                target=self._switch_book_audio, args=(book_index,), daemon=True
+            ).start()
+    
+    def _switch_book_ui(self, book_index: int) -> None:
+        """Show the new book and make it current.
+        
+        Args:
+            book_index: Index of the book to switch to
+        """
+        self.gpio_controller.update_book_leds(book_index)
+        
+        with self._book_lock:
+            # Stop the old book so the announcement does not resume it; this
+            # also zeroes the player position, and the status reader drops
+            # the old book's frames until the new book's load is acknowledged
+            self.audio_player.stop()
             
-            # Switch to new book
+            # Switch to new book; only the current book's position is stored,
+            # so the old position does not need saving first. The new index
+            # is written by the periodic save, off the button callback
             self.state_manager.set_book(book_index)
-            book = self.audiobooks[book_index]
-            print(f"Switching to: {book['name']}")
+        self._dirty.set()
+        log.info("Switching to: %s", self.audiobooks[book_index]['name'])
+    
+    def _switch_book_audio(self, book_index: int) -> None:
+        """Announce a book and start it from the beginning.
+        
+        Switches are played one at a time; one that a later button press
+        has already superseded is dropped.
+        
+        Args:
+            book_index: Index of the book to switch to
+        """
+        with self._switch_lock:
+            if not self.running or self._get_book() != book_index:
+                return
+            # An earlier switch may have started its book in the meantime
+            self.audio_player.stop()
             
-            # Play book announcement (file named {book_index + 1}.mp3)
-            announcement_file = f"{self.book_announcement_path}/{book_index + 1}.mp3"
-            self.audio_player.play_announcement(announcement_file)
+            # Play book announcement, if one was found at startup
+            if self._announcements_exist[book_index]:
+                self.audio_player.play_announcement(self._announcements[book_index])
+            else:
+                log.debug("No announcement found: %s", self._announcements[book_index])
             
-            # Start new book from beginning
-            self.audio_player.start(book['path'], 0.0)
-            self.gpio_controller.update_book_leds(book_index)
+            # Start new book from beginning, unless another press came in
+            # during the announcement
+            with self._book_lock:
+                if self.running and self._get_book() == book_index:
+                    self.audio_player.start(self.audiobooks[book_index]['path'], 0.0)
     
-    def _auto_save_loop(self) -> None:
-        """Automatically save state at regular intervals."""
-        while self.running:
-            time.sleep(self.save_interval)
-            
-            if self.audio_player.is_active():
-                current_position = self.audio_player.get_position()
-                self.state_manager.set_position(current_position)
-                self.state_manager.save_state()
+    def auto_save(self) -> None:
+        """Save state if it may have changed; called every save interval.
+        
+        Saves while playing, or once after a button press marked the state
+        dirty, so at most one write happens per interval however fast the
+        buttons are pressed.
+        """
+        if self._dirty.is_set() or self.audio_player.is_active():
+            self._dirty.clear()
+            self._persist_position()
+    
+    def _persist_position(self) -> None:
+        """Store the player's current position and save state."""
+        with self._book_lock:
+            self._set_pos(self._get_pos())
+        self._save()
     
     def cleanup(self) -> None:
         """Cleanup resources before exit."""
-        print("\n\nShutting down...")
+        log.info("Shutting down...")
         self.running = False
         
         # Save final state
-        if self.audio_player.is_active():
-            current_position = self.audio_player.get_position()
-            self.state_manager.set_position(current_position)
-            self.state_manager.save_state()
+        if self._dirty.is_set() or self.audio_player.is_active():
+            self._persist_position()
         
         # Cleanup components
         self.audio_player.cleanup()
         self.gpio_controller.cleanup()
+        self.state_manager.close()
         
-        print("Shutdown complete")
+        log.info("Shutdown complete")
 
 
 def load_config(config_file: str) -> dict:
@@ -192,45 +270,80 @@ def load_config(config_file: str) -> dict:
         Configuration dictionary
     """
     try:
-        with open(config_file, 'r') as f:
-            return json.load(f)
+        with open(config_file, 'rb') as f:
+            raw = f.read()
+        return orjson.loads(raw) if orjson else json.loads(raw)
     except Exception as e:
-        print(f"Error loading config: {e}")
+        log.error("Error loading config: %s", e)
         sys.exit(1)
 
 
+def setup_logging(verbose: bool) -> QueueListener:
+    """Route all log records through a queue to a background writer.
+    
+    Callers, including GPIO callbacks, still format each record (that is
+    done by QueueHandler.prepare()) but only enqueue it; the console write
+    happens on the listener's thread.
+    
+    Args:
+        verbose: If True, also log routine DEBUG messages
+        
+    Returns:
+        The started listener, to be stopped on exit
+    """
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter('%(message)s'))
+    
+    log_queue: queue.Queue = queue.Queue(-1)
+    root = logging.getLogger()
+    root.addHandler(QueueHandler(log_queue))
+    root.setLevel(logging.DEBUG if verbose else logging.INFO)
+    
+    listener = QueueListener(log_queue, handler)
+    listener.start()
+    return listener
+
+
 def main():
     """Main entry point."""
     parser = argparse.ArgumentParser(description='Raspberry Pi Audiobook Player')
     parser.add_argument('--mock', action='store_true', help='Run in mock mode for testing')
     parser.add_argument('--config', default='config.json', help='Path to config file')
+    parser.add_argument('--verbose', action='store_true', help='Log every player action')
+    parser.add_argument('--verbose-leds', action='store_true', help='Print LED changes in mock mode')
     args = parser.parse_args()
     
-    # Load configuration
-    config = load_config(args.config)
-    
-    # Create player
-    player = AudiobookPlayer(config, mock_mode=args.mock)
-    
-    # Setup signal handlers for clean shutdown
-    def signal_handler(sig, frame):
-        player.cleanup()
-        sys.exit(0)
-    
-    signal.signal(signal.SIGINT, signal_handler)
-    signal.signal(signal.SIGTERM, signal_handler)
-    
-    # Keep running
-    print("\nAudiobook Player running...")
-    print("Press Ctrl+C to exit\n")
-    
+    listener = setup_logging(args.verbose)
     try:
-        while player.running:
-            time.sleep(1)
-    except KeyboardInterrupt:
-        pass
+        # Load configuration
+        config = load_config(args.config)
+        
+        # Create player
+        player = AudiobookPlayer(config, mock_mode=args.mock, verbose_leds=args.verbose_leds)
+        
+        # Setup signal handlers for clean shutdown; they only wake the
+        # main thread, which then runs cleanup exactly once
+        shutdown = threading.Event()
+        
+        def signal_handler(sig, frame):
+            shutdown.set()
+        
+        signal.signal(signal.SIGINT, signal_handler)
+        signal.signal(signal.SIGTERM, signal_handler)
+        
+        log.info("Audiobook Player running...")
+        log.info("Press Ctrl+C to exit")
+        
+        # The main thread drives the periodic save; a signal ends the wait
+        # early, so shutdown is immediate
+        try:
+            while not shutdown.wait(player.save_interval):
+                player.auto_save()
+        finally:
+            player.cleanup()
     finally:
-        player.cleanup()
+        # Flush anything still queued before the process exits
+        listener.stop()
 
 
 if __name__ == '__main__':
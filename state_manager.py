@@ -1,9 +1,27 @@
 """State manager for saving and loading audiobook playback state."""
 import json
+import logging
+import mmap
 import os
+import struct
+import threading
 from typing import Optional
 
 
+log = logging.getLogger(__name__)
+
+# fdatasync skips the metadata flush fsync does; it is missing on macOS,
+# where mock mode may be run
+_datasync = getattr(os, 'fdatasync', os.fsync)
+
+# State file record: format tag, book index (uint32) and position (double)
+STATE_MAGIC = b'AB01'
+STATE_RECORD = struct.Struct('<4sId')
+
+# Position sidecar record: book index (uint32) and position (double)
+POSITION_RECORD = struct.Struct('<Id')
+
+
 class StateManager:
     """Manages persistent state for audiobook playback."""
     
@@ -11,50 +29,152 @@ class StateManager:
         """Initialize the state manager.
         
         Args:
-            state_file: Path to the JSON file for storing state
+            state_file: Path to the binary file for storing state
         """
         self.state_file = state_file
+        # Create the state directory once and keep it open, so each save
+        # opens and renames by name relative to it instead of walking the
+        # full path again
+        state_dir, self._state_name = os.path.split(os.path.abspath(state_file))
+        os.makedirs(state_dir, exist_ok=True)
+        self._dir_fd = os.open(state_dir, os.O_RDONLY | os.O_DIRECTORY)
+        self._state_tmp_name = self._state_name + '.tmp'
+        # Position-only updates go to a small unsynced sidecar; the state
+        # file is only rewritten, durably, when the book changes
+        self._pos_name = self._state_name + '.pos'
+        self._durable_book: Optional[int] = None
         self.current_book_index = 0
         self.current_position = 0.0
+        # Guards the book/position pair against torn reads across threads
+        self._lock = threading.Lock()
+        # (book, whole seconds) last written, so unchanged state is not rewritten
+        self._last_saved = (None, None)
         self.load_state()
     
     def load_state(self) -> None:
-        """Load state from file if it exists."""
+        """Load state from file if it exists.
+        
+        A JSON state file written by older versions is still read; it is
+        replaced by the binary format on the next save.
+        """
         if os.path.exists(self.state_file):
             try:
-                with open(self.state_file, 'r') as f:
-                    data = json.load(f)
-                    self.current_book_index = data.get('book_index', 0)
-                    self.current_position = data.get('position', 0.0)
-                    print(f"Loaded state: Book {self.current_book_index + 1}, Position {self.current_position:.1f}s")
-            except (json.JSONDecodeError, IOError) as e:
-                print(f"Error loading state: {e}")
+                fd = os.open(self._state_name, os.O_RDONLY, dir_fd=self._dir_fd)
+                try:
+                    size = os.fstat(fd).st_size
+                    magic = None
+                    if size == STATE_RECORD.size:
+                        # Unpack straight out of the mapping, without reading
+                        # the record into a bytes object first
+                        with mmap.mmap(fd, size, access=mmap.ACCESS_READ) as mm:
+                            magic, book_index, position = STATE_RECORD.unpack_from(mm)
+                    if magic == STATE_MAGIC:
+                        self.current_book_index = book_index
+                        self.current_position = position
+                        self._durable_book = book_index
+                    else:
+                        data = json.loads(os.read(fd, size))
+                        self.current_book_index = data.get('book_index', 0)
+                        self.current_position = data.get('position', 0.0)
+                finally:
+                    os.close(fd)
+                self._load_position_fast()
+                log.info("Loaded state: Book %d, Position %.1fs", self.current_book_index + 1, self.current_position)
+            except (ValueError, OSError) as e:
+                log.error("Error loading state: %s", e)
                 self.current_book_index = 0
                 self.current_position = 0.0
         else:
-            print("No saved state found, starting fresh")
+            log.info("No saved state found, starting fresh")
     
     def save_state(self) -> None:
-        """Save current state to file."""
+        """Save current state to file.
+        
+        Skipped when the book is unchanged and the position has moved by less
+        than a second since the last save, to spare the SD card.
+        """
+        # Snapshot both fields together so a concurrent set_book() cannot
+        # pair one book's index with another's position; the I/O below
+        # runs without the lock
+        with self._lock:
+            book_index, position = self.current_book_index, self.current_position
+        
+        key = (book_index, round(position))
+        if key == self._last_saved:
+            return
+        
+        if book_index == self._durable_book:
+            self._save_position_fast(book_index, position)
+            self._last_saved = key
+            return
+        
         try:
-            data = {
-                'book_index': self.current_book_index,
-                'position': self.current_position
-            }
-            with open(self.state_file, 'w') as f:
-                json.dump(data, f, indent=2)
-        except IOError as e:
-            print(f"Error saving state: {e}")
+            payload = STATE_RECORD.pack(STATE_MAGIC, book_index, position)
+            # Write a temporary file and rename it over the state file, so a
+            # power cut mid-write never leaves a truncated state behind
+            fd = os.open(self._state_tmp_name, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644,
+                         dir_fd=self._dir_fd)
+            try:
+                os.write(fd, payload)
+                _datasync(fd)
+            finally:
+                os.close(fd)
+            os.replace(self._state_tmp_name, self._state_name,
+                       src_dir_fd=self._dir_fd, dst_dir_fd=self._dir_fd)
+            self._durable_book = book_index
+            self._last_saved = key
+        except OSError as e:
+            log.error("Error saving state: %s", e)
+            return
+        
+        # Keep the sidecar in step so a stale one is never applied on load
+        self._save_position_fast(book_index, position)
+    
+    def _save_position_fast(self, book_index: int, position: float) -> None:
+        """Write a position to the fixed-size sidecar file.
+        
+        Not synced to disk: losing a few seconds of position in a power cut
+        is acceptable, and the book index is kept durable by the state file.
+        
+        Args:
+            book_index: Index of the book the position belongs to
+            position: Position in seconds
+        """
+        try:
+            fd = os.open(self._pos_name, os.O_WRONLY | os.O_CREAT, 0o644, dir_fd=self._dir_fd)
+            try:
+                os.write(fd, POSITION_RECORD.pack(book_index, position))
+            finally:
+                os.close(fd)
+        except OSError as e:
+            log.error("Error saving position: %s", e)
+    
+    def _load_position_fast(self) -> None:
+        """Apply the sidecar position if it belongs to the loaded book."""
+        try:
+            fd = os.open(self._pos_name, os.O_RDONLY, dir_fd=self._dir_fd)
+            try:
+                record = os.read(fd, POSITION_RECORD.size)
+            finally:
+                os.close(fd)
+        except OSError:
+            return
+        if len(record) == POSITION_RECORD.size:
+            book_index, position = POSITION_RECORD.unpack(record)
+            if book_index == self.current_book_index:
+                self.current_position = position
     
     def set_book(self, book_index: int) -> None:
-        """Set the current book index.
+        """Set the current book index and rewind to its start.
+        
+        The change is not written until the next save_state() call.
         
         Args:
             book_index: Index of the book (0-based)
         """
-        self.current_book_index = book_index
-        self.current_position = 0.0
-        self.save_state()
+        with self._lock:
+            self.current_book_index = book_index
+            self.current_position = 0.0
     
     def set_position(self, position: float) -> None:
         """Set the current playback position.
@@ -62,7 +182,8 @@ class StateManager:
         Args:
             position: Position in seconds
         """
-        self.current_position = max(0.0, position)
+        with self._lock:
+            self.current_position = max(0.0, position)
     
     def get_book(self) -> int:
         """Get the current book index.
@@ -79,4 +200,9 @@ class StateManager:
             Position in seconds
         """
         return self.current_position
-
+    
+    def close(self) -> None:
+        """Release the state directory handle."""
+        if self._dir_fd is not None:
+            os.close(self._dir_fd)
+            self._dir_fd = None